@@ -1,6 +1,32 @@
 import logging
 import time
 import math
+import contextlib
+import functools
+import struct
+
+
+@functools.lru_cache(maxsize=32)
+def _disk_bands(r):
+    """
+    Split a disk of radius r into horizontal bands of equal half width.
+
+    :param r: Disk radius.
+    :type r: int
+    :return: (first row, last row, half width) tuples, rows relative to the center.
+    :rtype: tuple
+    """
+    bands = []
+    band_start = -r
+    band_dx = 0
+    for dy in range(-r + 1, r + 2):
+        dx = math.isqrt(r * r - dy * dy) if dy <= r else None
+        if dx != band_dx:
+            bands.append((band_start, dy - 1, band_dx))
+            band_start = dy
+            band_dx = dx
+    return tuple(bands)
+
 
 class T5UIC1_LCD:
     """
@@ -18,8 +44,46 @@ class T5UIC1_LCD:
 
     # Data frame structure
     data_frame_head = b"\xAA"
-    data_frame_tail = [0xCC, 0x33, 0xC3, 0x3C]
-    data_frame = []
+    data_frame_tail = bytes((0xCC, 0x33, 0xC3, 0x3C))
+
+    # Precompiled big-endian layouts of the data frame fields
+    _fmt_byte = struct.Struct(">B")
+    _fmt_word = struct.Struct(">H")
+    _fmt_long = struct.Struct(">L")
+    _fmt_double_64 = struct.Struct(">Q")
+    _fmt_cmd_byte = struct.Struct(">BB")        # command, byte
+    _fmt_setdir = struct.Struct(">BBBB")        # command, 0x5A, 0xA5, dir
+    _fmt_jpeg = struct.Struct(">HB")            # command, id
+    _fmt_palette = struct.Struct(">BHH")        # command, fg, bg
+    _fmt_clear = struct.Struct(">BH")           # command, color
+    _fmt_point = struct.Struct(">BHBBHH")       # command, color, w, h, x, y
+    _fmt_line = struct.Struct(">BHHHHH")        # command, color, x0, y0, x1, y1
+    _fmt_rect = struct.Struct(">BBHHHH")        # command, mode, x0, y0, x1, y1
+    _fmt_text = struct.Struct(">BBHHHH")        # command, mode, fg, bg, x, y
+    _fmt_int = struct.Struct(">BBHHBBHHQ")      # command, mode, fg, bg, iNum, fNum, x, y, value
+    _fmt_float = struct.Struct(">BBHHBBHHL")    # command, mode, fg, bg, iNum, fNum, x, y, value
+    _fmt_icon = struct.Struct(">BHHBH")         # command, x, y, libID, picID
+    _fmt_move = struct.Struct(">BBHHHHHH")      # command, mode, offset, bg, x0, y0, x1, y1
+
+    # Default UART baud rate, used if the serial object does not report one
+    default_baud = 115200
+
+    # Bytes that may be queued in the bridge transmit buffer at once
+    tx_buffer_size = 128
+
+    # Largest chunk handed to the serial bridge in a single write
+    max_write_size = 40
+
+    # Expected handshake reply and the time to wait for it (in seconds)
+    handshake_reply = b"\xAA\x00OK"
+    handshake_timeout = 0.6
+    handshake_retries = 5
+
+    # Size of the receive ring buffer, must be a power of two
+    rx_buffer_size = 1024
+
+    # Number of encoded strings kept by string()
+    string_cache_size = 256
 
     # 3-.0：The font size, 0x00-0x09, corresponds to the font size below:
     # 0x00=6*12   0x01=8*16   0x02=10*20  0x03=12*24  0x04=14*28
@@ -95,18 +159,55 @@ class T5UIC1_LCD:
             serial : Serial object to send messages.
         """
         self.serial = serial
-        self.logging = True
+        self.logging = False
+        # Fragments of the frame being built, joined once in send()
+        self._parts = []
+        self._baud = getattr(serial, "baud", self.default_baud)
+        # Waiting for replies yields to the reactor when one is available
+        self._reactor = getattr(serial, "reactor", None)
+        self._tx_done_ts = 0.
+        self._batch_depth = 0
+        self._batch_buf = bytearray()
+        self._palette = (None, None)
+        # Single producer/single consumer receive ring buffer. The cursors
+        # are free-running, only the bridge callback moves _rx_tail and
+        # only _serial_read() moves _rx_head
+        self._rx_buf = bytearray(self.rx_buffer_size)
+        self._rx_head = 0
+        self._rx_tail = 0
+        # Received bytes are only stored while a reply is awaited
+        self._rx_wanted = False
+        self._str_cache = {}
+        self.serial.register_callback(self._handle_serial_read)
         logging.info("init")
     
     def init_display(self):
+        """
+        Perform the handshake and set up the display.
+
+        Gives up after handshake_retries failed handshakes, so the caller
+        can retry a missing display later.
+
+        :return: True if the display answered, otherwise False.
+        :rtype: bool
+        """
         self.log("entering init_display")
         self.log("Sending handshake... ")
-        while not self.handshake():
-            pass
+        for attempt in range(self.handshake_retries):
+            if self.handshake():
+                break
+        else:
+            self.error("no handshake response after %d attempts"
+                       % (self.handshake_retries,))
+            return False
         self.log("Handshake response: OK.")
-        self.jpg_showandcache(0)
-        self.frame_setdir(1)
-        self.update_lcd();
+        # The display starts with an unknown palette
+        self._palette = (None, None)
+        with self.batch():
+            self.jpg_showandcache(0)
+            self.frame_setdir(1)
+            self.update_lcd()
+        return True
 
     def byte(self, bool_val):
         """
@@ -115,7 +216,7 @@ class T5UIC1_LCD:
         :param bval: The byte value to be appended.
         :type bval: int
         """
-        self.data_frame += int(bool_val).to_bytes(1, byteorder="big")
+        self._parts.append(self._fmt_byte.pack(int(bool_val)))
 
     def word(self, word_val):
         """
@@ -124,7 +225,7 @@ class T5UIC1_LCD:
         :param wval: The two-byte value to be appended.
         :type wval: int
         """
-        self.data_frame += int(word_val).to_bytes(2, byteorder="big")
+        self._parts.append(self._fmt_word.pack(int(word_val)))
 
     def long(self, long_val):
         """
@@ -133,7 +234,7 @@ class T5UIC1_LCD:
         :param lval: The four-byte value to be appended.
         :type lval: int
         """
-        self.data_frame += int(long_val).to_bytes(4, byteorder="big")
+        self._parts.append(self._fmt_long.pack(int(long_val)))
 
     def double_64(self, double_val):
         """
@@ -142,33 +243,221 @@ class T5UIC1_LCD:
         :param dval: The eight-byte value to be appended.
         :type value: int
         """
-        self.data_frame += int(double_val).to_bytes(8, byteorder="big")
+        self._parts.append(self._fmt_double_64.pack(int(double_val)))
 
     def string(self, string):
         """
         Appends a UTF-8 encoded string to the data frame.
 
+        The encoding of recently used strings (menu labels, states) is
+        cached, the cache is emptied once it reaches string_cache_size.
+
         :param string: The string to be appended.
         :type string: str
         """
-        self.data_frame += string.encode("utf-8")
+        encoded = self._str_cache.get(string)
+        if encoded is None:
+            encoded = string.encode("utf-8")
+            if len(self._str_cache) >= self.string_cache_size:
+                self._str_cache.clear()
+            self._str_cache[string] = encoded
+        self._parts.append(encoded)
+
+    def _clip_xy(self, x, y):
+        """
+        Clamps a coordinate to the screen area.
+
+        :param x: X-coordinate.
+        :type x: int
+        :param y: Y-coordinate.
+        :type y: int
+        :return: The clamped (x, y) coordinate.
+        :rtype: tuple
+        """
+        return (
+            min(max(x, 0), self.screen_width - 1),
+            min(max(y, 0), self.screen_height - 1),
+        )
+
+    def _on_screen(self, x, y):
+        """
+        Checks whether a coordinate lies on the screen.
+
+        :param x: X-coordinate.
+        :type x: int
+        :param y: Y-coordinate.
+        :type y: int
+        :rtype: bool
+        """
+        return 0 <= x < self.screen_width and 0 <= y < self.screen_height
+
+    def _clip_rect(self, x_start, y_start, x_end, y_end):
+        """
+        Clamps a rectangle to the screen area.
+
+        :return: The clamped (x_start, y_start, x_end, y_end), or None if
+            the rectangle lies entirely off the screen.
+        :rtype: tuple
+        """
+        if (
+            x_end < 0
+            or y_end < 0
+            or x_start >= self.screen_width
+            or y_start >= self.screen_height
+        ):
+            return None
+        return self._clip_xy(x_start, y_start) + self._clip_xy(x_end, y_end)
+
+    def _clip_segment(self, x_start, y_start, x_end, y_end):
+        """
+        Clips a line segment to the screen area (Liang-Barsky).
+
+        Unlike clamping both ends, clipping keeps the slope of the segment.
+
+        :return: The clipped (x_start, y_start, x_end, y_end), or None if
+            the segment lies entirely off the screen.
+        :rtype: tuple
+        """
+        dx = x_end - x_start
+        dy = y_end - y_start
+        t0, t1 = 0., 1.
+        for p, q in (
+            (-dx, x_start),
+            (dx, self.screen_width - 1 - x_start),
+            (-dy, y_start),
+            (dy, self.screen_height - 1 - y_start),
+        ):
+            if p == 0:
+                if q < 0:
+                    return None
+                continue
+            t = float(q) / p
+            if p < 0:
+                if t > t1:
+                    return None
+                t0 = max(t0, t)
+            else:
+                if t < t0:
+                    return None
+                t1 = min(t1, t)
+        return (
+            int(round(x_start + t0 * dx)),
+            int(round(y_start + t0 * dy)),
+            int(round(x_start + t1 * dx)),
+            int(round(y_start + t1 * dy)),
+        )
+
+    def _emit(self, fmt, *values):
+        """
+        Appends several big-endian fields to the data frame at once.
+
+        :param fmt: Precompiled layout of the fields.
+        :type fmt: struct.Struct
+        :param values: The field values, in the order of the format string.
+        :type values: int
+        """
+        self._parts.append(fmt.pack(*[int(v) for v in values]))
 
     def send(self):
         """
         Sends the prepared data frame to the display according to the T5L_TA serial protocol.
 
-        Sends the current contents of the data frame, followed by a predefined
-        tail sequence. After sending, the data frame is reset to the head sequence.
+        Sends the head sequence and the current contents of the data frame,
+        followed by a predefined tail sequence, then starts a new empty frame.
+        While a batch is open the frame is queued and written on end_batch().
+        """
+        frame = b"".join(
+            (self.data_frame_head, *self._parts, self.data_frame_tail)
+        )
+
+        # Start an empty frame for the next transmission
+        self._parts = []
+
+        self._queue(frame)
+
+    def _pack(self, fmt, *values):
+        """
+        Builds a complete frame without touching the data frame in progress.
+
+        :param fmt: Precompiled layout of the fields.
+        :type fmt: struct.Struct
+        :param values: The field values, in the order of the layout.
+        :type values: int
+        :return: The frame, including head and tail.
+        :rtype: bytes
         """
-        # Write the current data frame and tail sequence to the serial connection
-        self.serial.write(self.data_frame)
-        self.serial.write(self.data_frame_tail)
+        return b"".join((
+            self.data_frame_head,
+            fmt.pack(*[int(v) for v in values]),
+            self.data_frame_tail,
+        ))
 
-        # Reset the data frame to the head sequence for the next transmission
-        self.data_frame = self.data_frame_head
+    def _queue(self, data):
+        """
+        Writes complete frames, or queues them while a batch is open.
 
-        # Delay to allow for proper transmission
-        time.sleep(0.001)
+        :param data: One or more complete frames.
+        :type data: bytes
+        """
+        if self._batch_depth:
+            self._batch_buf += data
+        else:
+            self._write(data)
+
+    def _write(self, data):
+        """
+        Writes raw frame data to the serial connection.
+
+        :param data: One or more complete frames.
+        :type data: bytes
+        """
+        # Time needed to shift one byte out of the UART (start + 8 + stop bits)
+        byte_time = 10. / self._baud
+
+        # Split large buffers so each write fits in a single bridge message
+        for i in range(0, len(data), self.max_write_size):
+            chunk = data[i:i + self.max_write_size]
+            now = time.monotonic()
+            # Only sleep if the chunk would overflow the bridge transmit
+            # buffer, given the bytes not yet shifted out at this baud rate
+            backlog = max(self._tx_done_ts - now, 0.)
+            excess = backlog - (self.tx_buffer_size - len(chunk)) * byte_time
+            if excess > 0.:
+                time.sleep(excess)
+                now += excess
+                backlog -= excess
+            self.serial.write(chunk)
+            self._tx_done_ts = now + backlog + len(chunk) * byte_time
+
+    def begin_batch(self):
+        """
+        Start queuing frames instead of writing them one by one.
+
+        Batches may be nested, the queued frames are written once the
+        outermost batch is closed.
+        """
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """
+        Close a batch and write all queued frames if it was the outermost one.
+        """
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_buf:
+            data = bytes(self._batch_buf)
+            self._batch_buf = bytearray()
+            self._write(data)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager wrapping begin_batch() and end_batch().
+        """
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
 
     def handshake(self):
         """
@@ -177,43 +466,105 @@ class T5UIC1_LCD:
         :return: True if handshake is successful, otherwise False.
         :rtype: bool
         """
-        # Send the initiation byte (0x00)
-        self.log("handshake")
-        self.byte(self.cmd_handshake)
-        self.send()
-        time.sleep(0.1)
-
-        max_retry = 26
-        req = 0
-        databuf = [None] * max_retry
-        while (self.serial.in_waiting and req<max_retry):
-                databuf[req] = struct.unpack('B', self.serial.read())[0] 
-                if databuf[0] != 0xAA:
-                        if (recnum>0):
-                                req=0
-                                databuf = [None] * max_retry
-                        continue
-                time.sleep(.010)
-                req += 1
-        retval = (req>=3 and databuf[0] == 0xAA and databuf[1] == 0 and chr(databuf[2]) == 'O' and chr(databuf[3]) == 'K')
-        self.log("handshake " + retval)
+        # Drop anything received before the handshake request
+        self._rx_wanted = True
+        self._serial_read()
+
+        try:
+            # Send the initiation byte (0x00)
+            self.log("handshake")
+            self._emit(self._fmt_byte, self.cmd_handshake)
+            self.send()
+
+            # Wait for the reply, returning as soon as it is complete
+            reply_len = len(self.handshake_reply)
+            deadline = time.monotonic() + self.handshake_timeout
+            buf = bytearray()
+            while True:
+                buf += self._serial_read()
+                # Skip any bytes preceding the start of a frame
+                start = buf.find(self.data_frame_head)
+                if start < 0:
+                    buf.clear()
+                elif start > 0:
+                    del buf[:start]
+                if len(buf) >= reply_len or time.monotonic() >= deadline:
+                    break
+                self._pause(0.005)
+        finally:
+            self._rx_wanted = False
+            self._serial_read()
+        retval = buf[:reply_len] == self.handshake_reply
+        self.log("handshake " + str(retval))
         return retval
 
-        # return True
+    def _pause(self, delay):
+        """
+        Waits for delay seconds without blocking the reactor if possible.
+
+        :param delay: The time to wait (in seconds).
+        :type delay: float
+        """
+        if self._reactor is None:
+            time.sleep(delay)
+        else:
+            self._reactor.pause(self._reactor.monotonic() + delay)
+
+    def _handle_serial_read(self, data):
+        """
+        Serial bridge callback, stores the received bytes.
+
+        :param data: The received bytes.
+        :type data: bytearray
+        """
+        # Nothing reads the display outside of the handshake
+        if not self._rx_wanted:
+            return
+        size = self.rx_buffer_size
+        tail = self._rx_tail
+        free = size - (tail - self._rx_head)
+        if len(data) > free:
+            self.error("receive buffer overflow, %d bytes dropped"
+                       % (len(data) - free))
+            data = data[:free]
+        count = len(data)
+        start = tail & (size - 1)
+        first = min(count, size - start)
+        self._rx_buf[start:start + first] = data[:first]
+        self._rx_buf[:count - first] = data[first:]
+        # Publish the bytes only once they are stored
+        self._rx_tail = tail + count
+
+    def _serial_read(self):
+        """
+        Returns and clears the bytes received since the last call.
+
+        :rtype: bytes
+        """
+        size = self.rx_buffer_size
+        head = self._rx_head
+        count = self._rx_tail - head
+        if not count:
+            return b""
+        start = head & (size - 1)
+        end = start + count
+        if end <= size:
+            data = bytes(self._rx_buf[start:end])
+        else:
+            data = bytes(self._rx_buf[start:]) + bytes(self._rx_buf[:end - size])
+        self._rx_head = head + count
+        return data
 
     # Set screen display direction
     #  dir: 0=0°, 1=90°, 2=180°, 3=270°
     def frame_setdir(self, dir):
         self.log("frame_setdir")
-        self.byte(self.cmd_frame_setdir)
-        self.byte(0x5A)
-        self.byte(0xA5)
-        self.byte(dir)
+        self._emit(self._fmt_setdir, self.cmd_frame_setdir, 0x5A, 0xA5, dir)
         self.send()
 
     def update_lcd(self):
         self.log("update_lcd")
-        self.byte(self.cmd_update_lcd)
+        self._emit(self._fmt_byte, self.cmd_update_lcd)
         self.send()
 
     def set_backlight_brightness(self, brightness):
@@ -224,14 +575,12 @@ class T5UIC1_LCD:
         :type luminance: int
         """
         self.log("backlight_brightness")
-        self.byte(self.cmd_backlight_brightness)
-        self.byte(max(brightness, 0x1f))
+        self._emit(self._fmt_cmd_byte, self.cmd_backlight_brightness, max(brightness, 0x1f))
         self.send()
 
     def jpg_showandcache(self, id):
         self.log("jpg_showandcache")
-        self.word(self.cmd_jpeg_showandcache)
-        self.byte(id)
+        self._emit(self._fmt_jpeg, self.cmd_jpeg_showandcache, id)
         self.send()
 
     def set_palette(self, background_color=color_black, foreground_color=color_white):
@@ -243,10 +592,12 @@ class T5UIC1_LCD:
         :param front_color: Foreground (text) color.
         :type front_color: int
         """
+        # Skip the frame if the display already uses these colors
+        if (background_color, foreground_color) == self._palette:
+            return
+        self._palette = (background_color, foreground_color)
         self.log("set_platette")
-        self.byte(self.cmd_set_palette)
-        self.word(foreground_color)
-        self.word(background_color)
+        self._emit(self._fmt_palette, self.cmd_set_palette, foreground_color, background_color)
         self.send()
 
     def clear_screen(self, color=color_black):
@@ -257,8 +608,7 @@ class T5UIC1_LCD:
         :type color: int
         """
         self.log("clear screen")
-        self.byte(self.cmd_clear_screen)
-        self.word(color)
+        self._emit(self._fmt_clear, self.cmd_clear_screen, color)
         self.send()
 
     def draw_point(self, color, w_x, w_y, p_x, p_y):
@@ -273,12 +623,10 @@ class T5UIC1_LCD:
         :type y: int
         """
         self.log("draw point")
-        self.byte(self.cmd_draw_line)
-        self.word(color)
-        self.byte(w_x) # x width
-        self.byte(w_y) # y width
-        self.word(int(p_x))
-        self.word(int(p_y))
+        # color, x width, y width, x, y
+        if not self._on_screen(p_x, p_y):
+            return
+        self._emit(self._fmt_point, self.cmd_draw_line, color, w_x, w_y, p_x, p_y)
         self.send()
 
     def draw_line(self, color, x_start, y_start, x_end, y_end):
@@ -297,12 +645,10 @@ class T5UIC1_LCD:
         :type y_end: int
         """
         self.log("draw line")
-        self.byte(self.cmd_draw_line)
-        self.word(color)
-        self.word(x_start)
-        self.word(y_start)
-        self.word(x_end)
-        self.word(y_end)
+        segment = self._clip_segment(x_start, y_start, x_end, y_end)
+        if segment is None:
+            return
+        self._emit(self._fmt_line, self.cmd_draw_line, color, *segment)
         self.send()
 
     def draw_rectangle(self, mode, color, x_start, y_start, x_end, y_end):
@@ -324,20 +670,88 @@ class T5UIC1_LCD:
         """
         self.log("draw rect")
         self.set_palette(self.color_white, color)
-        mode_to_command = {
-            0: self.cmd_draw_rectangle,
-            1: self.cmd_fill_rectangle,
-            2: self.cmd_reverse_color_area,
-        }
-        command = mode_to_command.get(mode, 0)
-        self.byte(self.cmd_draw_rect)
-        self.byte(mode)
-        self.word(x_start)
-        self.word(y_start)
-        self.word(x_end)
-        self.word(y_end)
+        self._draw_rectangle(mode, x_start, y_start, x_end, y_end)
+
+    def _draw_rectangle(self, mode, x_start, y_start, x_end, y_end):
+        """
+        Draw a rectangle with the current palette, see draw_rectangle().
+        """
+        rect = self._clip_rect(x_start, y_start, x_end, y_end)
+        if rect is None:
+            return
+        self._emit(self._fmt_rect, self.cmd_draw_rect, mode, *rect)
         self.send()
 
+    def pack_rectangle(self, mode, color, x_start, y_start, x_end, y_end):
+        """
+        Build the frames of draw_rectangle() without sending them.
+
+        The result can be stored and repainted with draw_blob(), which
+        avoids packing static rectangles again on every redraw.
+
+        :return: A blob, the palette and rectangle frames together with the
+            palette they leave set. The frames are empty if the rectangle
+            is off the screen.
+        :rtype: tuple
+        """
+        rect = self._clip_rect(x_start, y_start, x_end, y_end)
+        if rect is None:
+            return b"", None
+        frames = self._pack(
+            self._fmt_palette, self.cmd_set_palette, color, self.color_white
+        ) + self._pack(self._fmt_rect, self.cmd_draw_rect, mode, *rect)
+        return frames, (self.color_white, color)
+
+    def pack_line(self, color, x_start, y_start, x_end, y_end):
+        """
+        Build the frame of draw_line() without sending it, see pack_rectangle().
+
+        :return: A blob, the line frame (empty if the line is off the
+            screen) and None as the palette is left untouched.
+        :rtype: tuple
+        """
+        segment = self._clip_segment(x_start, y_start, x_end, y_end)
+        if segment is None:
+            return b"", None
+        frames = self._pack(self._fmt_line, self.cmd_draw_line, color, *segment)
+        return frames, None
+
+    def join_blobs(self, *blobs):
+        """
+        Concatenate blobs, leaving out palette frames that set the palette
+        the previous blob already left behind.
+
+        :return: The combined blob.
+        :rtype: tuple
+        """
+        joined = bytearray()
+        palette = None
+        for frames, blob_palette in blobs:
+            if palette is not None:
+                redundant = self._pack(
+                    self._fmt_palette, self.cmd_set_palette, palette[1], palette[0]
+                )
+                if frames.startswith(redundant):
+                    frames = frames[len(redundant):]
+            joined += frames
+            if blob_palette is not None:
+                palette = blob_palette
+        return bytes(joined), palette
+
+    def draw_blob(self, blob):
+        """
+        Send frames previously built with pack_rectangle(), pack_line() or
+        join_blobs().
+
+        :param blob: The frames and the palette they leave set.
+        :type blob: tuple
+        """
+        self.log("draw blob")
+        frames, palette = blob
+        self._queue(frames)
+        if palette is not None:
+            self._palette = palette
+
     def draw_circle(self, color, x_center, y_center, r):
         """
         Draw a circle on the screen using the draw points method.
@@ -351,39 +765,45 @@ class T5UIC1_LCD:
         :param r: Circle radius.
         :type r: int
         """
-        b = 0
+        # Integer midpoint circle algorithm, one octant is mirrored 8 times
         a = 0
-        while a <= b:
-            b = math.sqrt(r * r - a * a)
-            while a == 0:
-                b = b - 1
-                break
-            self.draw_point(
-                color, 1, 1, x_center + a, y_center + b
-            )  # Draw some sector 1
-            self.draw_point(
-                color, 1, 1, x_center + b, y_center + a
-            )  # Draw some sector 2
-            self.draw_point(
-                color, 1, 1, x_center + b, y_center - a
-            )  # Draw some sector 3
-            self.draw_point(
-                color, 1, 1, x_center + a, y_center - b
-            )  # Draw some sector 4
-
-            self.draw_point(
-                color, 1, 1, x_center - a, y_center - b
-            )  # Draw some sector 5
-            self.draw_point(
-                color, 1, 1, x_center - b, y_center - a
-            )  # Draw some sector 6
-            self.draw_point(
-                color, 1, 1, x_center - b, y_center + a
-            )  # Draw some sector 7
-            self.draw_point(
-                color, 1, 1, x_center - a, y_center + b
-            )  # Draw some sector 8
-            a += 1
+        b = r
+        d = 1 - r
+        # Bind the point emitter once, outside of the loop
+        draw_point = self.draw_point
+        with self.batch():
+            while a <= b:
+                draw_point(
+                    color, 1, 1, x_center + a, y_center + b
+                )  # Draw some sector 1
+                draw_point(
+                    color, 1, 1, x_center + b, y_center + a
+                )  # Draw some sector 2
+                draw_point(
+                    color, 1, 1, x_center + b, y_center - a
+                )  # Draw some sector 3
+                draw_point(
+                    color, 1, 1, x_center + a, y_center - b
+                )  # Draw some sector 4
+
+                draw_point(
+                    color, 1, 1, x_center - a, y_center - b
+                )  # Draw some sector 5
+                draw_point(
+                    color, 1, 1, x_center - b, y_center - a
+                )  # Draw some sector 6
+                draw_point(
+                    color, 1, 1, x_center - b, y_center + a
+                )  # Draw some sector 7
+                draw_point(
+                    color, 1, 1, x_center - a, y_center + b
+                )  # Draw some sector 8
+                a += 1
+                if d < 0:
+                    d += 2 * a + 1
+                else:
+                    b -= 1
+                    d += 2 * (a - b) + 1
 
     def fill_circle(self, font_color, x_center, y_center, r):
         """
@@ -398,40 +818,20 @@ class T5UIC1_LCD:
         :param r: Circle radius.
         :type r: int
         """
-        b = 0
-        for i in range(r, 0, -1):
-            a = 0
-            while a <= b:
-                b = math.sqrt(i * i - a * a)
-                while a == 0:
-                    b = b - 1
-                    break
-                self.draw_point(
-                    font_color, 2, 2, x_center + a, y_center + b
-                )  # Draw some sector 1
-                self.draw_point(
-                    font_color, 2, 2, x_center + b, y_center + a
-                )  # raw some sector 2
-                self.draw_point(
-                    font_color, 2, 2, x_center + b, y_center - a
-                )  # Draw some sector 3
-                self.draw_point(
-                    font_color, 2, 2, x_center + a, y_center - b
-                )  # Draw some sector 4
-
-                self.draw_point(
-                    font_color, 2, 2, x_center - a, y_center - b
-                )  # Draw some sector 5
-                self.draw_point(
-                    font_color, 2, 2, x_center - b, y_center - a
-                )  # Draw some sector 6
-                self.draw_point(
-                    font_color, 2, 2, x_center - b, y_center + a
-                )  # Draw some sector 7
-                self.draw_point(
-                    font_color, 2, 2, x_center - a, y_center + b
-                )  # Draw some sector 8
-                a = a + 2
+        # Scanline fill using the hardware fill rectangle, the bands of
+        # each radius are computed once and reused
+        bands = _disk_bands(int(r))
+        draw_rectangle = self._draw_rectangle
+        with self.batch():
+            self.set_palette(self.color_white, font_color)
+            for dy_start, dy_end, dx in bands:
+                draw_rectangle(
+                    1,
+                    x_center - dx,
+                    y_center + dy_start,
+                    x_center + dx,
+                    y_center + dy_end,
+                )
 
     def draw_string(
         self, show_background, size, font_color, background_color, x, y, string
@@ -457,16 +857,21 @@ class T5UIC1_LCD:
 
         width_adjust=1
         self.log("draw text")
-        self.byte(self.cmd_draw_text)
+        x, y = self._clip_xy(x, y)
         # bit 7 : width_adjust
         # bit 6 : show
         # bit 4-5: unused 0
         # bit 0-3: size 
-        self.byte(size | (show_background * 0x40) | (width_adjust * 0x80))  # mode (bshow)
-        self.word(font_color)
-        self.word(background_color)
-        self.word(x)
-        self.word(y)
+        mode = size | (show_background * 0x40) | (width_adjust * 0x80)  # mode (bshow)
+        self._emit(
+            self._fmt_text,
+            self.cmd_draw_text,
+            mode,
+            font_color,
+            background_color,
+            x,
+            y,
+        )
         self.string(string[:40])
         self.send()
 
@@ -508,26 +913,31 @@ class T5UIC1_LCD:
         :type value: int
         """
         self.log("draw int")
-        self.byte(self.cmd_draw_int)
+        x, y = self._clip_xy(x, y)
         # Bit 7: bshow
         # Bit 6: 1 = signed; 0 = unsigned number;
         # Bit 5: zeroFill
         # Bit 4: zeroMode
         # Bit 3-0: size
-        self.byte(
+        mode = (
             (show_background * 0x80)
             | (0 * 0x40)
             | (zeroFill * 0x20)
             | (zeroMode * 0x10)
             | font_size
         )
-        self.word(color)
-        self.word(background_color)
-        self.byte(iNum)
-        self.byte(0)  # fNum
-        self.word(x)
-        self.word(y)
-        self.double_64(value)
+        self._emit(
+            self._fmt_int,
+            self.cmd_draw_int,
+            mode,
+            color,
+            background_color,
+            iNum,
+            0,  # fNum
+            x,
+            y,
+            value,
+        )
         self.send()
 
     def draw_float_value(
@@ -571,26 +981,30 @@ class T5UIC1_LCD:
         :type value: float
         """
         self.log("draw float")
-        self.byte(self.cmd_draw_value)
+        x, y = self._clip_xy(x, y)
         # Bit 7: bshow
         # Bit 6: 1 = signed; 0 = unsigned number;
         # Bit 5: zeroFill
         # Bit 4: zeroMode
         # Bit 3-0: size
-        self.byte(
+        mode = (
             (show_background * 0x80)
-            | (0 * 0x40)
             | (zeroFill * 0x20)
             | (zeroMode * 0x10)
             | size
         )
-        self.word(color)
-        self.word(background_color)
-        self.byte(iNum)
-        self.byte(fNum)
-        self.word(x)
-        self.word(y)
-        self.long(value)
+        self._emit(
+            self._fmt_float,
+            self.cmd_draw_value,
+            mode,
+            color,
+            background_color,
+            iNum,
+            fNum,
+            x,
+            y,
+            value,
+        )
         self.send()
 
     def draw_signed_float(
@@ -614,26 +1028,17 @@ class T5UIC1_LCD:
         :param value: Floating-point value to be displayed.
         :type value: float
         """
-        if value < 0:
+        # The sign sits one glyph left of x; batch it with the digits so
+        # both frames go out in a single write
+        with self.batch():
             self.draw_string(
-                show_background, size, color, background_color, x - 6, y - 3, "-"
-            )
-            self.draw_float_value(
                 show_background,
-                False,
-                0,
                 size,
                 color,
                 background_color,
-                iNum,
-                fNum,
-                x,
-                y,
-                -value,
-            )
-        else:
-            self.draw_string(
-                show_background, size, color, background_color, x - 6, y - 3, " "
+                x - 6,
+                y - 3,
+                "-" if value < 0 else " ",
             )
             self.draw_float_value(
                 show_background,
@@ -646,9 +1051,68 @@ class T5UIC1_LCD:
                 fNum,
                 x,
                 y,
-                value,
+                abs(value),
             )
 
+    def draw_label_value(
+        self,
+        show_background,
+        size,
+        color,
+        background_color,
+        x,
+        y,
+        label,
+        value,
+        iNum,
+        fNum=0,
+        suffix="",
+    ):
+        """
+        Draw a label and a number as a single text frame.
+
+        The number is formatted on the host and right aligned on iNum whole
+        digits, so a label and its value cost one frame instead of two.
+        Use draw_int_value/draw_float_value when the display must do the
+        formatting (e.g. zero fill).
+
+        :param show_background: True to display the background color, False to not display the background color.
+        :type show_background: bool
+        :param size: Font size.
+        :type size: int
+        :param color: Character color.
+        :type color: int
+        :param background_color: Background color.
+        :type background_color: int
+        :param x: X-coordinate of the upper-left corner.
+        :type x: int
+        :param y: Y-coordinate of the upper-left corner.
+        :type y: int
+        :param label: Text drawn before the number.
+        :type label: str
+        :param value: Number to be displayed.
+        :type value: float
+        :param iNum: Number of whole digits.
+        :type iNum: int
+        :param fNum: Number of decimal digits.
+        :type fNum: int
+        :param suffix: Text drawn after the number.
+        :type suffix: str
+        """
+        if fNum:
+            number = "%*.*f" % (iNum + fNum + 1, fNum, value)
+        else:
+            number = "%*d" % (iNum, value)
+        self.draw_string(
+            show_background,
+            size,
+            color,
+            background_color,
+            x,
+            y,
+            label + number + suffix,
+        )
+
     def draw_icon(self, show_background, libID, picID, x, y):
         """
         Draw an icon on the screen.
@@ -665,16 +1129,9 @@ class T5UIC1_LCD:
         :type y: int
         """
         self.log("draw icon")
-        if x > self.screen_width - 1:
-            x = self.screen_width - 1
-        if y > self.screen_height - 1:
-            y = self.screen_height - 1
-        self.byte(self.cmd_draw_icon)
-        self.word(x)
-        self.word(y)
-        self.byte(libID)
+        x, y = self._clip_xy(x, y)
         # self.byte(show_background * 0x01)
-        self.word(picID)
+        self._emit(self._fmt_icon, self.cmd_draw_icon, x, y, libID, picID)
         self.send()
 
     def draw_image(self, id=1):
@@ -685,8 +1142,8 @@ class T5UIC1_LCD:
         :type id: int
         """
         self.log("show image")
-        self.byte(self.cmd_show_image)
-        self.byte(id)
+        # The show image command is two bytes wide, like jpg_showandcache
+        self._emit(self._fmt_jpeg, self.cmd_show_image, id)
         self.send()
 
     def move_screen_area(
@@ -711,20 +1168,27 @@ class T5UIC1_LCD:
         :type y_end: int
         """
         self.log("move screen area")
-        self.byte(self.cmd_move_screen_area)
+        x_start, y_start = self._clip_xy(x_start, y_start)
+        x_end, y_end = self._clip_xy(x_end, y_end)
         # mode 0: circle shift, 1: translation, mode << 7
-        self.byte(0x80 | direction)
-        self.word(offset)
-        self.word(background_color)
-        self.word(x_start)
-        self.word(y_start)
-        self.word(x_end)
-        self.word(y_end)
+        self._emit(
+            self._fmt_move,
+            self.cmd_move_screen_area,
+            0x80 | direction,
+            offset,
+            background_color,
+            x_start,
+            y_start,
+            x_end,
+            y_end,
+        )
         self.send()
 
     def log(self, msg, *args, **kwargs):
+        # Formatting is left to the logging module, so a disabled log only
+        # costs the attribute check on the draw path
         if self.logging:
-            logging.info("T5UIC1 LCD: " + str(msg))
+            logging.info("T5UIC1 LCD: %s", msg)
     
     def error(self, msg, *args, **kwargs):
-        logging.error("T5UIC1 LCD: " + str(msg))
+        logging.error("T5UIC1 LCD: %s", msg)
@@ -545,10 +545,45 @@ class E3v3seDisplay:
         
         self.lcd = T5UIC1_LCD(self.serial_bridge)
         self.lcd.logging = self._logging
+
+        # Static backgrounds are packed once and repainted with one write
+        self._blob_title_bar = self.lcd.pack_rectangle(
+            1,
+            self.color_background_grey,
+            0,
+            0,
+            self.lcd.screen_width,
+            self.HEADER_HEIGHT,
+        )
+        self._blob_menu_area = self.lcd.pack_rectangle(
+            1,
+            self.color_background_black,
+            0,
+            self.HEADER_HEIGHT,
+            self.lcd.screen_width,
+            self.STATUS_Y,
+        )
+        self._blob_status_area = self.lcd.pack_rectangle(
+            1,
+            self.color_background_black,
+            0,
+            self.STATUS_Y,
+            self.lcd.screen_width,
+            self.lcd.screen_height,
+        )
+        self._blob_main_window = self.lcd.join_blobs(
+            self._blob_title_bar, self._blob_menu_area
+        )
+        self._blob_screen = self.lcd.join_blobs(
+            self._blob_main_window, self._blob_status_area
+        )
+
         self.checkkey = self.MainMenu
         self.pd = PrinterData(config)
 
         self._update_interval = 1
+        # Time between handshake attempts while no display answers
+        self._reset_retry_interval = 10.
         self._update_timer = self.reactor.register_timer(self.EachMomentUpdate)
 
     def key_event(self, key, eventtime):
@@ -590,9 +625,11 @@ class E3v3seDisplay:
          
     def _reset_screen(self, eventtime):
         self.log("Reset Screen")
+        if not self.lcd.init_display():
+            # Do not start the UI without a display, try again later
+            return self.reactor.monotonic() + self._reset_retry_interval
         self.reactor.register_timer(
             self._screen_init, self.reactor.monotonic() + 2.)
-        self.lcd.init_display()
         return self.reactor.NEVER
     
     def lcdExit(self):
@@ -603,15 +640,16 @@ class E3v3seDisplay:
         return 45 + self.MLINE * L
 
     def HMI_StartFrame(self, with_update):
-        self.Clear_Screen()
-        self.last_status = self.pd.status
-        if self.pd.status == "printing":
-            self.Goto_PrintProcess()
-            self.Draw_Status_Area(with_update)
-        elif self.pd.status in ["operational", "complete", "standby", "cancelled"]:
-            self.Goto_MainMenu()
-        else:
-            self.Goto_MainMenu()
+        with self.lcd.batch():
+            self.Clear_Screen()
+            self.last_status = self.pd.status
+            if self.pd.status == "printing":
+                self.Goto_PrintProcess()
+                self.Draw_Status_Area(with_update)
+            elif self.pd.status in ["operational", "complete", "standby", "cancelled"]:
+                self.Goto_MainMenu()
+            else:
+                self.Goto_MainMenu()
 
     def HMI_MainMenu(self):
         encoder_state = self.get_encoder_state()
@@ -2224,181 +2262,135 @@ class E3v3seDisplay:
     # --------------------------------------------------------------#
 
     def Draw_Status_Area(self, with_update=True):
-        #  Clear the bottom area of the screen
-        self.lcd.draw_rectangle(
-            1,
-            self.color_background_black,
-            0,
-            self.STATUS_Y,
-            self.lcd.screen_width,
-            self.lcd.screen_height - 1,
-        )
+        with self.lcd.batch():
+            #  Clear the bottom area of the screen
+            self.lcd.draw_rectangle(
+                1,
+                self.color_background_black,
+                0,
+                self.STATUS_Y,
+                self.lcd.screen_width,
+                self.lcd.screen_height - 1,
+            )
 
-        # nozzle temp area
-        if self.pd.nozzleIsHeating():
-            self.lcd.draw_icon(True, self.GIF_ICON, self.icon_nozzle_heating_0, 6, 262)
-        else:
-            self.lcd.draw_icon(True, self.ICON, self.icon_hotend_temp, 6, 262) 
+            # nozzle temp area
+            if self.pd.nozzleIsHeating():
+                self.lcd.draw_icon(True, self.GIF_ICON, self.icon_nozzle_heating_0, 6, 262)
+            else:
+                self.lcd.draw_icon(True, self.ICON, self.icon_hotend_temp, 6, 262) 
 
-        self.lcd.draw_int_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_yellow if self.pd.nozzleIsHeating() else self.color_white,
-            self.color_background_black,
-            3,
-            26,
-            268,
-            self.pd.thermalManager["temp_hotend"][0]["celsius"],
-        )
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            26 + 3 * self.STAT_CHR_W + 4,
-            268,
-            "/",
-        )
-        self.lcd.draw_int_value(
-            False,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            26 + 3 * self.STAT_CHR_W + 5,
-            268,
-            self.pd.thermalManager["temp_hotend"][0]["target"],
-        )
+            self.lcd.draw_int_value(
+                True,
+                True,
+                0,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_yellow if self.pd.nozzleIsHeating() else self.color_white,
+                self.color_background_black,
+                3,
+                26,
+                268,
+                self.pd.thermalManager["temp_hotend"][0]["celsius"],
+            )
+            self.lcd.draw_label_value(
+                False,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_white,
+                self.color_background_black,
+                26 + 3 * self.STAT_CHR_W + 4,
+                268,
+                "/",
+                self.pd.thermalManager["temp_hotend"][0]["target"],
+                3,
+            )
 
-        # bed temp area
-        if self.pd.bedIsHeating():
-            self.lcd.draw_icon(True, self.GIF_ICON, self.icon_bed_heating_0, 6, 294)
-        else:
-            self.lcd.draw_icon(True, self.ICON, self.icon_bedtemp, 6, 294)
+            # bed temp area
+            if self.pd.bedIsHeating():
+                self.lcd.draw_icon(True, self.GIF_ICON, self.icon_bed_heating_0, 6, 294)
+            else:
+                self.lcd.draw_icon(True, self.ICON, self.icon_bedtemp, 6, 294)
 
-        self.lcd.draw_int_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_yellow if self.pd.bedIsHeating() else self.color_white,
-            self.color_background_black,
-            3,
-            26,
-            300,
-            self.pd.thermalManager["temp_bed"]["celsius"],
-        )
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            26 + 3 * self.STAT_CHR_W + 4,
-            300,
-            "/",
-        )
-        self.lcd.draw_int_value(
-            False,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            26 + 3 * self.STAT_CHR_W + 5,
-            300,
-            self.pd.thermalManager["temp_bed"]["target"],
-        )
+            self.lcd.draw_int_value(
+                True,
+                True,
+                0,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_yellow if self.pd.bedIsHeating() else self.color_white,
+                self.color_background_black,
+                3,
+                26,
+                300,
+                self.pd.thermalManager["temp_bed"]["celsius"],
+            )
+            self.lcd.draw_label_value(
+                False,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_white,
+                self.color_background_black,
+                26 + 3 * self.STAT_CHR_W + 4,
+                300,
+                "/",
+                self.pd.thermalManager["temp_bed"]["target"],
+                3,
+            )
 
-        # speed area
-        self.lcd.draw_icon(True, self.ICON, self.icon_speed, 99, 262)
-        self.lcd.draw_int_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            99 + 2 * self.STAT_CHR_W,
-            268,
-            self.pd.feedrate_percentage,
-        )
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            99 + 5 * self.STAT_CHR_W + 2,
-            268,
-            "%",
-        )
+            # speed area
+            self.lcd.draw_icon(True, self.ICON, self.icon_speed, 99, 262)
+            self.lcd.draw_label_value(
+                True,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_white,
+                self.color_background_black,
+                99 + 2 * self.STAT_CHR_W,
+                268,
+                "",
+                self.pd.feedrate_percentage,
+                3,
+                suffix="%",
+            )
 
-        # extrude area
-        self.lcd.draw_icon(True, self.ICON, self.icon_MaxSpeedE, 99, 294)
-        self.lcd.draw_int_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            99 + 2 * self.STAT_CHR_W,
-            300,
-            self.pd.extrusion_multiplier,
-        )
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            99 + 5 * self.STAT_CHR_W + 2,
-            300,
-            "%",
-        )
+            # extrude area
+            self.lcd.draw_icon(True, self.ICON, self.icon_MaxSpeedE, 99, 294)
+            self.lcd.draw_label_value(
+                True,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_white,
+                self.color_background_black,
+                99 + 2 * self.STAT_CHR_W,
+                300,
+                "",
+                self.pd.extrusion_multiplier,
+                3,
+                suffix="%",
+            )
 
-        # fan speed area
-        self.lcd.draw_icon(True, self.ICON, self.icon_FanSpeed, 165, 262)
-        self.lcd.draw_int_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            165 + 2 * self.STAT_CHR_W,
-            268,
-            self.pd.fan_speed,
-        )
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            165 + 5 * self.STAT_CHR_W + 2,
-            268,
-            "%",
-        )
+            # fan speed area
+            self.lcd.draw_icon(True, self.ICON, self.icon_FanSpeed, 165, 262)
+            self.lcd.draw_label_value(
+                True,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_white,
+                self.color_background_black,
+                165 + 2 * self.STAT_CHR_W,
+                268,
+                "",
+                self.pd.fan_speed,
+                3,
+                suffix="%",
+            )
 
-        # Z offset area
-        self.lcd.draw_icon(True, self.ICON, self.icon_z_offset, 165, 294)
-        self.lcd.draw_signed_float(
-            True,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            1,
-            3,
-            191,
-            300,
-            self.pd.BABY_Z_VAR * 1000,
-        )
+            # Z offset area
+            self.lcd.draw_icon(True, self.ICON, self.icon_z_offset, 165, 294)
+            self.lcd.draw_signed_float(
+                True,
+                self.lcd.DWIN_FONT_STAT,
+                self.color_white,
+                self.color_background_black,
+                1,
+                3,
+                191,
+                300,
+                self.pd.BABY_Z_VAR * 1000,
+            )
 
         if with_update:
             time.sleep(0.005)
@@ -2667,86 +2659,89 @@ class E3v3seDisplay:
         )
 
     def Draw_Print_File_Menu(self):
-        self.Clear_Title_Bar()
-        # Draw "File Selection" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_file_selection,
-            self.HEADER_HEIGHT,
-            1,
-        )
-        self.Redraw_SD_List()
-        self.Draw_Status_Area()
+        with self.lcd.batch():
+            self.Clear_Title_Bar()
+            # Draw "File Selection" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_file_selection,
+                self.HEADER_HEIGHT,
+                1,
+            )
+            self.Redraw_SD_List()
+            self.Draw_Status_Area()
 
     def Draw_Prepare_Menu(self):
-        self.Clear_Main_Window()
-        # Draw "Prepare" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_prepare,
-            self.HEADER_HEIGHT,
-            1,
-        )
+        with self.lcd.batch():
+            self.Clear_Main_Window()
+            # Draw "Prepare" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_prepare,
+                self.HEADER_HEIGHT,
+                1,
+            )
 
-        scroll = self.MROWS - self.index_prepare
-        # self.Frame_TitleCopy(1, 178, 2, 229, 14)  # "Prepare"
-        self.Draw_Back_First(self.select_prepare.now == 0)  # < Back
-        if scroll + self.PREPARE_CASE_MOVE <= self.MROWS:
-            self.Item_Prepare_Move(self.PREPARE_CASE_MOVE)  # Move >
-        if scroll + self.PREPARE_CASE_DISA <= self.MROWS:
-            self.Item_Prepare_Disable(self.PREPARE_CASE_DISA)  # Disable Stepper
-        if scroll + self.PREPARE_CASE_HOME <= self.MROWS:
-            self.Item_Prepare_Home(self.PREPARE_CASE_HOME)  # Auto Home
-        if self.pd.HAS_ZOFFSET_ITEM:
-            if scroll + self.PREPARE_CASE_ZOFF <= self.MROWS:
-                self.Item_Prepare_Offset(
-                    self.PREPARE_CASE_ZOFF
-                )  # Edit Z-Offset / Babystep / Set Home Offset
-        if self.pd.HAS_HOTEND:
-            if scroll + self.PREPARE_CASE_PLA <= self.MROWS:
-                self.Item_Prepare_PLA(self.PREPARE_CASE_PLA)  # Preheat PLA
-            if scroll + self.PREPARE_CASE_TPU <= self.MROWS:
-                self.Item_Prepare_TPU(self.PREPARE_CASE_TPU)  # Preheat TPU
-        if self.pd.HAS_PREHEAT:
-            if scroll + self.PREPARE_CASE_COOL <= self.MROWS:
-                self.Item_Prepare_Cool(self.PREPARE_CASE_COOL)  # Cooldown
-        if self.select_prepare.now:
-            self.Draw_Menu_Cursor(self.select_prepare.now)
-        self.Draw_Status_Area()
+            scroll = self.MROWS - self.index_prepare
+            # self.Frame_TitleCopy(1, 178, 2, 229, 14)  # "Prepare"
+            self.Draw_Back_First(self.select_prepare.now == 0)  # < Back
+            if scroll + self.PREPARE_CASE_MOVE <= self.MROWS:
+                self.Item_Prepare_Move(self.PREPARE_CASE_MOVE)  # Move >
+            if scroll + self.PREPARE_CASE_DISA <= self.MROWS:
+                self.Item_Prepare_Disable(self.PREPARE_CASE_DISA)  # Disable Stepper
+            if scroll + self.PREPARE_CASE_HOME <= self.MROWS:
+                self.Item_Prepare_Home(self.PREPARE_CASE_HOME)  # Auto Home
+            if self.pd.HAS_ZOFFSET_ITEM:
+                if scroll + self.PREPARE_CASE_ZOFF <= self.MROWS:
+                    self.Item_Prepare_Offset(
+                        self.PREPARE_CASE_ZOFF
+                    )  # Edit Z-Offset / Babystep / Set Home Offset
+            if self.pd.HAS_HOTEND:
+                if scroll + self.PREPARE_CASE_PLA <= self.MROWS:
+                    self.Item_Prepare_PLA(self.PREPARE_CASE_PLA)  # Preheat PLA
+                if scroll + self.PREPARE_CASE_TPU <= self.MROWS:
+                    self.Item_Prepare_TPU(self.PREPARE_CASE_TPU)  # Preheat TPU
+            if self.pd.HAS_PREHEAT:
+                if scroll + self.PREPARE_CASE_COOL <= self.MROWS:
+                    self.Item_Prepare_Cool(self.PREPARE_CASE_COOL)  # Cooldown
+            if self.select_prepare.now:
+                self.Draw_Menu_Cursor(self.select_prepare.now)
+            self.Draw_Status_Area()
 
     def Draw_Control_Menu(self):
-        self.Clear_Main_Window()
-        # Draw "Control" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_control,
-            self.HEADER_HEIGHT,
-            1,
-        )
+        with self.lcd.batch():
+            self.Clear_Main_Window()
+            # Draw "Control" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_control,
+                self.HEADER_HEIGHT,
+                1,
+            )
 
-        self.Draw_Back_First(self.select_control.now == 0)
+            self.Draw_Back_First(self.select_control.now == 0)
 
-        # self.Frame_TitleCopy(1, 128, 2, 176, 12)
-        # self.lcd.move_screen_area(1, 1, 89, 83, 101, self.LBLX, self.MBASE(self.CONTROL_CASE_TEMP))  # Temperature >
-        # self.lcd.move_screen_area(1, 84, 89, 128, 99, self.LBLX, self.MBASE(self.CONTROL_CASE_MOVE))  # Motion >
-        # self.lcd.move_screen_area(1, 0, 104, 25, 115, self.LBLX, self.MBASE(self.CONTROL_CASE_INFO))  # Info >
+            # self.Frame_TitleCopy(1, 128, 2, 176, 12)
+            # self.lcd.move_screen_area(1, 1, 89, 83, 101, self.LBLX, self.MBASE(self.CONTROL_CASE_TEMP))  # Temperature >
+            # self.lcd.move_screen_area(1, 84, 89, 128, 99, self.LBLX, self.MBASE(self.CONTROL_CASE_MOVE))  # Motion >
+            # self.lcd.move_screen_area(1, 0, 104, 25, 115, self.LBLX, self.MBASE(self.CONTROL_CASE_INFO))  # Info >
 
-        if self.select_control.now and self.select_control.now < self.MROWS:
-            self.Draw_Menu_Cursor(self.select_control.now)
+            if self.select_control.now and self.select_control.now < self.MROWS:
+                self.Draw_Menu_Cursor(self.select_control.now)
 
-        # # Draw icons and lines
-        self.Draw_Menu_Line_With_Only_Icons(
-            1, self.icon_temperature, self.icon_TEXT_temperature
-        )
-        self.Draw_More_Icon(1)
-        self.Draw_Menu_Line_With_Only_Icons(2, self.icon_motion, self.icon_TEXT_motion)
-        self.Draw_More_Icon(2)
-        self.Draw_Menu_Line_With_Only_Icons(3, self.icon_info, self.icon_TEXT_Info)
-        self.Draw_More_Icon(3)
-        self.Draw_Status_Area()
+            # # Draw icons and lines
+            self.Draw_Menu_Line_With_Only_Icons(
+                1, self.icon_temperature, self.icon_TEXT_temperature
+            )
+            self.Draw_More_Icon(1)
+            self.Draw_Menu_Line_With_Only_Icons(2, self.icon_motion, self.icon_TEXT_motion)
+            self.Draw_More_Icon(2)
+            self.Draw_Menu_Line_With_Only_Icons(3, self.icon_info, self.icon_TEXT_Info)
+            self.Draw_More_Icon(3)
+            self.Draw_Status_Area()
 
     def Draw_Leveling_Menu(self):
         self.Clear_Main_Window()
@@ -2757,138 +2752,121 @@ class E3v3seDisplay:
         As the text stays on the bottom of each line instead of
         a normal menu item, this is manually drawn.
         """
-        self.Clear_Main_Window()
-        # Draw "Info" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_info,
-            self.HEADER_HEIGHT,
-            1,
-        )
+        with self.lcd.batch():
+            self.Clear_Main_Window()
+            # Draw "Info" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_info,
+                self.HEADER_HEIGHT,
+                1,
+            )
 
-        self.Draw_Back_First()
+            self.Draw_Back_First()
 
-        # Bed size 80,95,110,140,155,170,200,215,230,260
-        self.lcd.draw_icon(
-            True, self.selected_language, self.icon_TEXT_bed_size, self.LBLX, 75
-        )
-        self.lcd.draw_icon(True, self.ICON, self.icon_PrintSize, 20, 90)
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_6x12,
-            self.color_white,
-            self.color_background_black,
-            70,
-            105,
-            self.pd.MACHINE_SIZE,
-        )
+            # Bed size 80,95,110,140,155,170,200,215,230,260
+            self.lcd.draw_icon(
+                True, self.selected_language, self.icon_TEXT_bed_size, self.LBLX, 75
+            )
+            self.lcd.draw_icon(True, self.ICON, self.icon_PrintSize, 20, 90)
+            self.lcd.draw_string(
+                False,
+                self.lcd.font_6x12,
+                self.color_white,
+                self.color_background_black,
+                70,
+                105,
+                self.pd.MACHINE_SIZE,
+            )
 
-        # Klipper version
-        self.lcd.draw_icon(
-            True,
-            self.selected_language,
-            self.icon_TEXT_hardware_version,
-            self.LBLX,
-            135,
-        )
-        self.lcd.draw_icon(True, self.ICON, self.icon_Version, 20, 140)
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_6x12,
-            self.color_white,
-            self.color_background_black,
-            50,
-            155,
-            "Klipper " + self.pd.SHORT_BUILD_VERSION,
-        )
+            # Klipper version
+            self.lcd.draw_icon(
+                True,
+                self.selected_language,
+                self.icon_TEXT_hardware_version,
+                self.LBLX,
+                135,
+            )
+            self.lcd.draw_icon(True, self.ICON, self.icon_Version, 20, 140)
+            self.lcd.draw_string(
+                False,
+                self.lcd.font_6x12,
+                self.color_white,
+                self.color_background_black,
+                50,
+                155,
+                "Klipper " + self.pd.SHORT_BUILD_VERSION,
+            )
 
-        # Contact details
-        self.lcd.draw_icon(
-            True, self.selected_language, self.icon_TEXT_contact, self.LBLX, 185
-        )
-        self.lcd.draw_icon(True, self.ICON, self.icon_Contact, 20, 200)
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            50,
-            215,
-            "github.com/jpcurti/",
-        )
-        self.lcd.draw_string(
-            False,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            30,
-            230,
-            "ender3-v3-se-klipper-with-display",
-        )
-        self.Draw_Status_Area()
+            # Contact details
+            self.lcd.draw_icon(
+                True, self.selected_language, self.icon_TEXT_contact, self.LBLX, 185
+            )
+            self.lcd.draw_icon(True, self.ICON, self.icon_Contact, 20, 200)
+            self.lcd.draw_string(
+                False,
+                self.lcd.font_8x8,
+                self.color_white,
+                self.color_background_black,
+                50,
+                215,
+                "github.com/jpcurti/",
+            )
+            self.lcd.draw_string(
+                False,
+                self.lcd.font_8x8,
+                self.color_white,
+                self.color_background_black,
+                30,
+                230,
+                "ender3-v3-se-klipper-with-display",
+            )
+            self.Draw_Status_Area()
 
     def Draw_Tune_Menu(self):
-        self.Clear_Main_Window()
-        # Draw "Tune" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_tune,
-            self.HEADER_HEIGHT,
-            1,
-        )
-        self.lcd.move_screen_area(1, 94, 2, 126, 12, 14, 9)
-        self.lcd.move_screen_area(
-            1, 1, 179, 92, 190, self.LBLX, self.MBASE(self.TUNE_CASE_SPEED)
-        )  # Print speed
-        if self.pd.HAS_HOTEND:
-            self.lcd.move_screen_area(
-                1, 197, 104, 238, 114, self.LBLX, self.MBASE(self.TUNE_CASE_TEMP)
-            )  # Hotend...
-            self.lcd.move_screen_area(
-                1, 1, 89, 83, 101, self.LBLX + 44, self.MBASE(self.TUNE_CASE_TEMP)
-            )  # Temperature
-        if self.pd.HAS_HEATED_BED:
-            self.lcd.move_screen_area(
-                1, 240, 104, 264, 114, self.LBLX, self.MBASE(self.TUNE_CASE_BED)
-            )  # Bed...
-            self.lcd.move_screen_area(
-                1, 1, 89, 83, 101, self.LBLX + 27, self.MBASE(self.TUNE_CASE_BED)
-            )  # ...Temperature
-        if self.pd.HAS_FAN:
-            self.lcd.move_screen_area(
-                1, 0, 119, 64, 132, self.LBLX, self.MBASE(self.TUNE_CASE_FAN)
-            )  # Fan speed
-        if self.pd.HAS_ZOFFSET_ITEM:
+        with self.lcd.batch():
+            self.Clear_Main_Window()
+            # Draw "Tune" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_tune,
+                self.HEADER_HEIGHT,
+                1,
+            )
+            self.lcd.move_screen_area(1, 94, 2, 126, 12, 14, 9)
             self.lcd.move_screen_area(
-                1, 93, 179, 141, 189, self.LBLX, self.MBASE(self.TUNE_CASE_ZOFF)
-            )  # Z-offset
-        self.Draw_Back_First(self.select_tune.now == 0)
-        if self.select_tune.now:
-            self.Draw_Menu_Cursor(self.select_tune.now)
+                1, 1, 179, 92, 190, self.LBLX, self.MBASE(self.TUNE_CASE_SPEED)
+            )  # Print speed
+            if self.pd.HAS_HOTEND:
+                self.lcd.move_screen_area(
+                    1, 197, 104, 238, 114, self.LBLX, self.MBASE(self.TUNE_CASE_TEMP)
+                )  # Hotend...
+                self.lcd.move_screen_area(
+                    1, 1, 89, 83, 101, self.LBLX + 44, self.MBASE(self.TUNE_CASE_TEMP)
+                )  # Temperature
+            if self.pd.HAS_HEATED_BED:
+                self.lcd.move_screen_area(
+                    1, 240, 104, 264, 114, self.LBLX, self.MBASE(self.TUNE_CASE_BED)
+                )  # Bed...
+                self.lcd.move_screen_area(
+                    1, 1, 89, 83, 101, self.LBLX + 27, self.MBASE(self.TUNE_CASE_BED)
+                )  # ...Temperature
+            if self.pd.HAS_FAN:
+                self.lcd.move_screen_area(
+                    1, 0, 119, 64, 132, self.LBLX, self.MBASE(self.TUNE_CASE_FAN)
+                )  # Fan speed
+            if self.pd.HAS_ZOFFSET_ITEM:
+                self.lcd.move_screen_area(
+                    1, 93, 179, 141, 189, self.LBLX, self.MBASE(self.TUNE_CASE_ZOFF)
+                )  # Z-offset
+            self.Draw_Back_First(self.select_tune.now == 0)
+            if self.select_tune.now:
+                self.Draw_Menu_Cursor(self.select_tune.now)
 
-        self.Draw_Menu_Line_With_Only_Icons(
-            self.TUNE_CASE_SPEED, self.icon_speed, self.icon_TEXT_Printing_Speed
-        )
-        self.lcd.draw_int_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            200,
-            self.MBASE(self.TUNE_CASE_SPEED) - 8,
-            self.pd.feedrate_percentage,
-        )
-
-        if self.pd.HAS_HOTEND:
             self.Draw_Menu_Line_With_Only_Icons(
-                self.TUNE_CASE_TEMP,
-                self.icon_hotend_temp,
-                self.icon_TEXT_nozzle_temperature,
+                self.TUNE_CASE_SPEED, self.icon_speed, self.icon_TEXT_Printing_Speed
             )
             self.lcd.draw_int_value(
                 True,
@@ -2899,85 +2877,254 @@ class E3v3seDisplay:
                 self.color_background_black,
                 3,
                 200,
-                self.MBASE(self.TUNE_CASE_TEMP) - 8,
-                self.pd.thermalManager["temp_hotend"][0]["target"],
+                self.MBASE(self.TUNE_CASE_SPEED) - 8,
+                self.pd.feedrate_percentage,
+            )
+
+            if self.pd.HAS_HOTEND:
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TUNE_CASE_TEMP,
+                    self.icon_hotend_temp,
+                    self.icon_TEXT_nozzle_temperature,
+                )
+                self.lcd.draw_int_value(
+                    True,
+                    True,
+                    0,
+                    self.lcd.font_8x8,
+                    self.color_white,
+                    self.color_background_black,
+                    3,
+                    200,
+                    self.MBASE(self.TUNE_CASE_TEMP) - 8,
+                    self.pd.thermalManager["temp_hotend"][0]["target"],
+                )
+
+            if self.pd.HAS_HEATED_BED:
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TUNE_CASE_BED, self.icon_bedtemp, self.icon_TEXT_bed_temperature
+                )
+                self.lcd.draw_int_value(
+                    True,
+                    True,
+                    0,
+                    self.lcd.font_8x8,
+                    self.color_white,
+                    self.color_background_black,
+                    3,
+                    200,
+                    self.MBASE(self.TUNE_CASE_BED) - 8,
+                    self.pd.thermalManager["temp_bed"]["target"],
+                )
+
+            if self.pd.HAS_FAN:
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TUNE_CASE_FAN, self.icon_FanSpeed, self.icon_TEXT_fan_speed
+                )
+                self.lcd.draw_int_value(
+                    True,
+                    True,
+                    0,
+                    self.lcd.font_8x8,
+                    self.color_white,
+                    self.color_background_black,
+                    3,
+                    200,
+                    self.MBASE(self.TUNE_CASE_FAN) - 8,
+                    self.pd.thermalManager["fan_speed"][0],
+                )
+            if self.pd.HAS_ZOFFSET_ITEM:
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TUNE_CASE_ZOFF, self.icon_z_offset, self.icon_TEXT_Z_Offset
+                )
+                self.lcd.draw_signed_float(
+                    True,
+                    self.lcd.font_8x8,
+                    self.color_white,
+                    self.color_background_black,
+                    2,
+                    3,
+                    175,
+                    self.MBASE(self.TUNE_CASE_ZOFF) - 10,
+                    self.pd.BABY_Z_VAR * 100,
+                )
+
+    def Draw_Temperature_Menu(self):
+        with self.lcd.batch():
+            self.Clear_Main_Window()
+            # Draw "Temperature" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_temperature,
+                self.HEADER_HEIGHT,
+                1,
+            )
+
+            self.Draw_Back_First(self.select_temp.now == 0)
+            if self.select_temp.now:
+                self.Draw_Menu_Cursor(self.select_temp.now)
+
+            # Draw icons and lines
+            i = 0
+            if self.pd.HAS_HOTEND:
+                i += 1
+                # self.Draw_Menu_Line( self.TEMP_CASE_TEMP, self.icon_SetEndTemp, "Nozzle Temperature")
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TEMP_CASE_TEMP,
+                    self.icon_SetEndTemp,
+                    self.icon_TEXT_nozzle_temperature,
+                )
+                self.lcd.draw_int_value(
+                    True,
+                    True,
+                    0,
+                    self.lcd.font_8x8,
+                    self.color_white,
+                    self.color_background_black,
+                    3,
+                    200,
+                    self.MBASE(i) - 8,
+                    self.pd.thermalManager["temp_hotend"][0]["target"],
+                )
+            if self.pd.HAS_HEATED_BED:
+                i += 1
+                # self.Draw_Menu_Line( (self.TEMP_CASE_BED), self.icon_SetEndTemp, "Bed Temperature")
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TEMP_CASE_BED, self.icon_SetEndTemp, self.icon_TEXT_bed_temperature
+                )
+                self.lcd.draw_int_value(
+                    True,
+                    True,
+                    0,
+                    self.lcd.font_8x8,
+                    self.color_white,
+                    self.color_background_black,
+                    3,
+                    200,
+                    self.MBASE(i) - 8,
+                    self.pd.thermalManager["temp_bed"]["target"],
+                )
+            if self.pd.HAS_FAN:
+                i += 1
+                self.Draw_Menu_Line_With_Only_Icons(
+                    (self.TEMP_CASE_FAN),
+                    self.icon_SetEndTemp,
+                    self.icon_TEXT_nozzle_temperature,
+                )
+                self.lcd.draw_int_value(
+                    True,
+                    True,
+                    0,
+                    self.lcd.font_8x8,
+                    self.color_white,
+                    self.color_background_black,
+                    3,
+                    200,
+                    self.MBASE(i) - 8,
+                    self.pd.thermalManager["fan_speed"][0],
+                )
+            if self.pd.HAS_HOTEND:
+                # PLA/TPU items have submenus
+                i += 1
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TEMP_CASE_PLA,
+                    self.icon_SetEndTemp,
+                    self.icon_TEXT_preheat_pla_settings,
+                )
+                self.Draw_More_Icon(i)
+                i += 1
+                self.Draw_Menu_Line_With_Only_Icons(
+                    self.TEMP_CASE_TPU,
+                    self.icon_SetEndTemp,
+                    self.icon_TEXT_preheat_tpu_settings,
+                )
+                self.Draw_More_Icon(i)
+
+    def Draw_Motion_Menu(self):
+        with self.lcd.batch():
+            self.Clear_Main_Window()
+            # Draw "Motion" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_motion,
+                self.HEADER_HEIGHT,
+                1,
             )
+            self.draw_max_en(self.MBASE(self.MOTION_CASE_RATE))
+            self.draw_speed_en(27, self.MBASE(self.MOTION_CASE_RATE))  # "Max Speed"
+            self.draw_max_accel_en(self.MBASE(self.MOTION_CASE_ACCEL))  # "Max Acceleration"
+            self.draw_steps_per_mm(self.MBASE(self.MOTION_CASE_STEPS))  # "Steps-per-mm"
+
+            self.Draw_Back_First(self.select_motion.now == 0)
+            if self.select_motion.now:
+                self.Draw_Menu_Cursor(self.select_motion.now)
 
-        if self.pd.HAS_HEATED_BED:
             self.Draw_Menu_Line_With_Only_Icons(
-                self.TUNE_CASE_BED, self.icon_bedtemp, self.icon_TEXT_bed_temperature
+                self.MOTION_CASE_RATE, self.icon_MaxSpeed, self.icon_TEXT_max_speed
             )
-            self.lcd.draw_int_value(
-                True,
-                True,
-                0,
-                self.lcd.font_8x8,
-                self.color_white,
-                self.color_background_black,
-                3,
-                200,
-                self.MBASE(self.TUNE_CASE_BED) - 8,
-                self.pd.thermalManager["temp_bed"]["target"],
+            self.Draw_More_Icon(self.MOTION_CASE_RATE)
+
+            self.Draw_Menu_Line_With_Only_Icons(
+                self.MOTION_CASE_ACCEL,
+                self.icon_MaxAccelerated,
+                self.icon_TEXT_max_acceleration,
             )
+            self.Draw_More_Icon(self.MOTION_CASE_ACCEL)
 
-        if self.pd.HAS_FAN:
             self.Draw_Menu_Line_With_Only_Icons(
-                self.TUNE_CASE_FAN, self.icon_FanSpeed, self.icon_TEXT_fan_speed
+                self.MOTION_CASE_STEPS, self.icon_Step, self.icon_TEXT_steps_per_mm
             )
-            self.lcd.draw_int_value(
-                True,
-                True,
-                0,
-                self.lcd.font_8x8,
-                self.color_white,
-                self.color_background_black,
-                3,
-                200,
-                self.MBASE(self.TUNE_CASE_FAN) - 8,
-                self.pd.thermalManager["fan_speed"][0],
+            self.Draw_More_Icon(self.MOTION_CASE_STEPS)
+
+    def Draw_Move_Menu(self):
+        """
+        Only visual: Draws the "Move" menu on the display.
+
+        This method clears the main window and then proceeds to draw the "Move" header.
+        It also draws the options for moving the X, Y, and Z axes, as well as the extruder
+        option if available. It also handles drawing the menu cursor and separators.
+        """
+        with self.lcd.batch():
+            self.Clear_Main_Window()
+            self.pd.get_additional_values()
+            # Draw "Move" on header
+            self.lcd.draw_icon(
+                False,
+                self.selected_language,
+                self.icon_TEXT_header_move,
+                self.HEADER_HEIGHT,
+                1,
             )
-        if self.pd.HAS_ZOFFSET_ITEM:
+
+            self.Draw_Back_First(self.select_axis.now == 0)
+            if self.select_axis.now:
+                self.Draw_Menu_Cursor(self.select_axis.now)
+
+            line_count = 1
             self.Draw_Menu_Line_With_Only_Icons(
-                self.TUNE_CASE_ZOFF, self.icon_z_offset, self.icon_TEXT_Z_Offset
+                line_count, self.icon_move_x, self.icon_TEXT_move_x
             )
-            self.lcd.draw_signed_float(
+            self.lcd.draw_float_value(
                 True,
+                True,
+                0,
                 self.lcd.font_8x8,
                 self.color_white,
                 self.color_background_black,
-                2,
                 3,
+                1,
                 175,
-                self.MBASE(self.TUNE_CASE_ZOFF) - 10,
-                self.pd.BABY_Z_VAR * 100,
+                self.MBASE(line_count) - 10,
+                self.pd.current_position.x * self.MINUNITMULT,
             )
 
-    def Draw_Temperature_Menu(self):
-        self.Clear_Main_Window()
-        # Draw "Temperature" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_temperature,
-            self.HEADER_HEIGHT,
-            1,
-        )
-
-        self.Draw_Back_First(self.select_temp.now == 0)
-        if self.select_temp.now:
-            self.Draw_Menu_Cursor(self.select_temp.now)
-
-        # Draw icons and lines
-        i = 0
-        if self.pd.HAS_HOTEND:
-            i += 1
-            # self.Draw_Menu_Line( self.TEMP_CASE_TEMP, self.icon_SetEndTemp, "Nozzle Temperature")
+            line_count += 1
             self.Draw_Menu_Line_With_Only_Icons(
-                self.TEMP_CASE_TEMP,
-                self.icon_SetEndTemp,
-                self.icon_TEXT_nozzle_temperature,
+                line_count, self.icon_move_y, self.icon_TEXT_move_y
             )
-            self.lcd.draw_int_value(
+            self.lcd.draw_float_value(
                 True,
                 True,
                 0,
@@ -2985,17 +3132,17 @@ class E3v3seDisplay:
                 self.color_white,
                 self.color_background_black,
                 3,
-                200,
-                self.MBASE(i) - 8,
-                self.pd.thermalManager["temp_hotend"][0]["target"],
+                1,
+                175,
+                self.MBASE(line_count) - 10,
+                self.pd.current_position.y * self.MINUNITMULT,
             )
-        if self.pd.HAS_HEATED_BED:
-            i += 1
-            # self.Draw_Menu_Line( (self.TEMP_CASE_BED), self.icon_SetEndTemp, "Bed Temperature")
+
+            line_count += 1
             self.Draw_Menu_Line_With_Only_Icons(
-                self.TEMP_CASE_BED, self.icon_SetEndTemp, self.icon_TEXT_bed_temperature
+                line_count, self.icon_move_z, self.icon_TEXT_move_z
             )
-            self.lcd.draw_int_value(
+            self.lcd.draw_float_value(
                 True,
                 True,
                 0,
@@ -3003,18 +3150,17 @@ class E3v3seDisplay:
                 self.color_white,
                 self.color_background_black,
                 3,
-                200,
-                self.MBASE(i) - 8,
-                self.pd.thermalManager["temp_bed"]["target"],
+                1,
+                175,
+                self.MBASE(line_count) - 10,
+                self.pd.current_position.z * self.MINUNITMULT,
             )
-        if self.pd.HAS_FAN:
-            i += 1
+
+            line_count += 1
             self.Draw_Menu_Line_With_Only_Icons(
-                (self.TEMP_CASE_FAN),
-                self.icon_SetEndTemp,
-                self.icon_TEXT_nozzle_temperature,
+                line_count, self.icon_move_e, self.icon_TEXT_move_e
             )
-            self.lcd.draw_int_value(
+            self.lcd.draw_float_value(
                 True,
                 True,
                 0,
@@ -3022,250 +3168,82 @@ class E3v3seDisplay:
                 self.color_white,
                 self.color_background_black,
                 3,
-                200,
-                self.MBASE(i) - 8,
-                self.pd.thermalManager["fan_speed"][0],
-            )
-        if self.pd.HAS_HOTEND:
-            # PLA/TPU items have submenus
-            i += 1
-            self.Draw_Menu_Line_With_Only_Icons(
-                self.TEMP_CASE_PLA,
-                self.icon_SetEndTemp,
-                self.icon_TEXT_preheat_pla_settings,
-            )
-            self.Draw_More_Icon(i)
-            i += 1
-            self.Draw_Menu_Line_With_Only_Icons(
-                self.TEMP_CASE_TPU,
-                self.icon_SetEndTemp,
-                self.icon_TEXT_preheat_tpu_settings,
+                1,
+                175,
+                self.MBASE(line_count) - 10,
+                self.pd.current_position.e * self.MINUNITMULT,
             )
-            self.Draw_More_Icon(i)
-
-    def Draw_Motion_Menu(self):
-        self.Clear_Main_Window()
-        # Draw "Motion" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_motion,
-            self.HEADER_HEIGHT,
-            1,
-        )
-        self.draw_max_en(self.MBASE(self.MOTION_CASE_RATE))
-        self.draw_speed_en(27, self.MBASE(self.MOTION_CASE_RATE))  # "Max Speed"
-        self.draw_max_accel_en(self.MBASE(self.MOTION_CASE_ACCEL))  # "Max Acceleration"
-        self.draw_steps_per_mm(self.MBASE(self.MOTION_CASE_STEPS))  # "Steps-per-mm"
-
-        self.Draw_Back_First(self.select_motion.now == 0)
-        if self.select_motion.now:
-            self.Draw_Menu_Cursor(self.select_motion.now)
-
-        self.Draw_Menu_Line_With_Only_Icons(
-            self.MOTION_CASE_RATE, self.icon_MaxSpeed, self.icon_TEXT_max_speed
-        )
-        self.Draw_More_Icon(self.MOTION_CASE_RATE)
-
-        self.Draw_Menu_Line_With_Only_Icons(
-            self.MOTION_CASE_ACCEL,
-            self.icon_MaxAccelerated,
-            self.icon_TEXT_max_acceleration,
-        )
-        self.Draw_More_Icon(self.MOTION_CASE_ACCEL)
-
-        self.Draw_Menu_Line_With_Only_Icons(
-            self.MOTION_CASE_STEPS, self.icon_Step, self.icon_TEXT_steps_per_mm
-        )
-        self.Draw_More_Icon(self.MOTION_CASE_STEPS)
-
-    def Draw_Move_Menu(self):
-        """
-        Only visual: Draws the "Move" menu on the display.
-
-        This method clears the main window and then proceeds to draw the "Move" header.
-        It also draws the options for moving the X, Y, and Z axes, as well as the extruder
-        option if available. It also handles drawing the menu cursor and separators.
-        """
-        self.Clear_Main_Window()
-        self.pd.get_additional_values()
-        # Draw "Move" on header
-        self.lcd.draw_icon(
-            False,
-            self.selected_language,
-            self.icon_TEXT_header_move,
-            self.HEADER_HEIGHT,
-            1,
-        )
-
-        self.Draw_Back_First(self.select_axis.now == 0)
-        if self.select_axis.now:
-            self.Draw_Menu_Cursor(self.select_axis.now)
-
-        line_count = 1
-        self.Draw_Menu_Line_With_Only_Icons(
-            line_count, self.icon_move_x, self.icon_TEXT_move_x
-        )
-        self.lcd.draw_float_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            1,
-            175,
-            self.MBASE(line_count) - 10,
-            self.pd.current_position.x * self.MINUNITMULT,
-        )
-
-        line_count += 1
-        self.Draw_Menu_Line_With_Only_Icons(
-            line_count, self.icon_move_y, self.icon_TEXT_move_y
-        )
-        self.lcd.draw_float_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            1,
-            175,
-            self.MBASE(line_count) - 10,
-            self.pd.current_position.y * self.MINUNITMULT,
-        )
-
-        line_count += 1
-        self.Draw_Menu_Line_With_Only_Icons(
-            line_count, self.icon_move_z, self.icon_TEXT_move_z
-        )
-        self.lcd.draw_float_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            1,
-            175,
-            self.MBASE(line_count) - 10,
-            self.pd.current_position.z * self.MINUNITMULT,
-        )
-
-        line_count += 1
-        self.Draw_Menu_Line_With_Only_Icons(
-            line_count, self.icon_move_e, self.icon_TEXT_move_e
-        )
-        self.lcd.draw_float_value(
-            True,
-            True,
-            0,
-            self.lcd.font_8x8,
-            self.color_white,
-            self.color_background_black,
-            3,
-            1,
-            175,
-            self.MBASE(line_count) - 10,
-            self.pd.current_position.e * self.MINUNITMULT,
-        )
 
     def Goto_MainMenu(self):
-        self.checkkey = self.MainMenu
-        self.Clear_Screen()
-        # Draw "Main" on header
-        self.lcd.draw_icon(
-            True, self.selected_language, self.icon_TEXT_header_main, 29, 1
-        )
+        with self.lcd.batch():
+            self.checkkey = self.MainMenu
+            self.Clear_Screen()
+            # Draw "Main" on header
+            self.lcd.draw_icon(
+                True, self.selected_language, self.icon_TEXT_header_main, 29, 1
+            )
 
-        self.icon_Print()
-        self.icon_Prepare()
-        self.icon_Control()
-        if self.pd.HAS_ONESTEP_LEVELING:
-            self.icon_Leveling(self.select_page.now == 3)
-        else:
-            self.icon_StartInfo(self.select_page.now == 3)
+            self.icon_Print()
+            self.icon_Prepare()
+            self.icon_Control()
+            if self.pd.HAS_ONESTEP_LEVELING:
+                self.icon_Leveling(self.select_page.now == 3)
+            else:
+                self.icon_StartInfo(self.select_page.now == 3)
 
     def Goto_PrintProcess(self):
-        self.checkkey = self.PrintProcess
-        self.Clear_Main_Window()
-        # Draw "Printing" on header
-        self.lcd.draw_icon(
-            True, self.selected_language, self.icon_TEXT_header_printing, 29, 1
-        )
-        self.Draw_Printing_Screen()
-
-        self.show_tune()
-        if self.pd.printingIsPaused():
-            self.show_continue()
-        else:
-            self.show_pause()
-        self.show_stop()
-
-        # Copy into filebuf string before entry
-        name = self.pd.file_name
-        if name:
-            npos = _MAX(0, self.lcd.screen_width - len(name) * self.MENU_CHR_W) / 2
-            self.lcd.draw_string(
-                False,
-                self.lcd.font_6x12,
-                self.color_white,
-                self.color_background_black,
-                npos,
-                40,
-                name,
+        with self.lcd.batch():
+            self.checkkey = self.PrintProcess
+            self.Clear_Main_Window()
+            # Draw "Printing" on header
+            self.lcd.draw_icon(
+                True, self.selected_language, self.icon_TEXT_header_printing, 29, 1
             )
+            self.Draw_Printing_Screen()
 
-        self.Draw_Print_ProgressBar()
-        self.Draw_Print_ProgressElapsed()
-        self.Draw_Print_ProgressRemain()
-        self.Draw_Status_Area()
+            self.show_tune()
+            if self.pd.printingIsPaused():
+                self.show_continue()
+            else:
+                self.show_pause()
+            self.show_stop()
+
+            # Copy into filebuf string before entry
+            name = self.pd.file_name
+            if name:
+                npos = _MAX(0, self.lcd.screen_width - len(name) * self.MENU_CHR_W) / 2
+                self.lcd.draw_string(
+                    False,
+                    self.lcd.font_6x12,
+                    self.color_white,
+                    self.color_background_black,
+                    npos,
+                    40,
+                    name,
+                )
+
+            self.Draw_Print_ProgressBar()
+            self.Draw_Print_ProgressElapsed()
+            self.Draw_Print_ProgressRemain()
+            self.Draw_Status_Area()
 
     # --------------------------------------------------------------#
     # --------------------------------------------------------------#
 
     def Clear_Title_Bar(self):
-        self.lcd.draw_rectangle(
-            1,
-            self.color_background_grey,
-            0,
-            0,
-            self.lcd.screen_width,
-            self.HEADER_HEIGHT,
-        )
+        self.lcd.draw_blob(self._blob_title_bar)
 
     def Clear_Menu_Area(self):
-        self.lcd.draw_rectangle(
-            1,
-            self.color_background_black,
-            0,
-            self.HEADER_HEIGHT,
-            self.lcd.screen_width,
-            self.STATUS_Y,
-        )
+        self.lcd.draw_blob(self._blob_menu_area)
 
     def Clear_Status_Area(self):
-        self.lcd.draw_rectangle(
-            1,
-            self.color_background_black,
-            0,
-            self.STATUS_Y,
-            self.lcd.screen_width,
-            self.lcd.screen_height,
-        )
+        self.lcd.draw_blob(self._blob_status_area)
 
     def Clear_Main_Window(self):
-        self.Clear_Title_Bar()
-        self.Clear_Menu_Area()
+        self.lcd.draw_blob(self._blob_main_window)
 
     def Clear_Screen(self):
-        self.Clear_Title_Bar()
-        self.Clear_Menu_Area()
-        self.Clear_Status_Area()
+        self.lcd.draw_blob(self._blob_screen)
 
     def Clear_Popup_Area(self):
         self.Clear_Title_Bar()
@@ -3438,36 +3416,37 @@ class E3v3seDisplay:
 
     # Redraw the first set of SD Files
     def Redraw_SD_List(self):
-        self.select_file.reset()
-        self.index_file = self.MROWS
-        self.Clear_Menu_Area()  # Leave title bar unchanged, clear only middle of screen
-        self.Draw_Back_First()
-        fl = self.pd.GetFiles()
-        ed = len(fl)
-        if ed > 0:
-            if ed > self.MROWS:
-                ed = self.MROWS
-            for i in range(ed):
-                self.Draw_SDItem(i, i + 1)
-        else:
-            self.lcd.draw_rectangle(
-                1,
-                self.color_background_red,
-                11,
-                25,
-                self.MBASE(3) - 10,
-                self.lcd.screen_width - 10,
-                self.MBASE(4),
-            )
-            self.lcd.draw_string(
-                False,
-                self.lcd.font_16x32,
-                self.color_yellow,
-                self.color_background_red,
-                ((self.lcd.screen_width) - 8 * 16) / 2,
-                self.MBASE(3),
-                "No Media",
-            )
+        with self.lcd.batch():
+            self.select_file.reset()
+            self.index_file = self.MROWS
+            self.Clear_Menu_Area()  # Leave title bar unchanged, clear only middle of screen
+            self.Draw_Back_First()
+            fl = self.pd.GetFiles()
+            ed = len(fl)
+            if ed > 0:
+                if ed > self.MROWS:
+                    ed = self.MROWS
+                for i in range(ed):
+                    self.Draw_SDItem(i, i + 1)
+            else:
+                self.lcd.draw_rectangle(
+                    1,
+                    self.color_background_red,
+                    11,
+                    25,
+                    self.MBASE(3) - 10,
+                    self.lcd.screen_width - 10,
+                    self.MBASE(4),
+                )
+                self.lcd.draw_string(
+                    False,
+                    self.lcd.font_16x32,
+                    self.color_yellow,
+                    self.color_background_red,
+                    ((self.lcd.screen_width) - 8 * 16) / 2,
+                    self.MBASE(3),
+                    "No Media",
+                )
 
     def CompletedHoming(self):
         self.pd.HMI_flag.home_flag = False
@@ -3672,63 +3651,64 @@ class E3v3seDisplay:
     # --------------------------------------------------------------#
 
     def EachMomentUpdate(self, eventtime):
-        # variable update
-        update = self.pd.update_variable()
-        if self.last_status != self.pd.status:
-            self.last_status = self.pd.status
-            self.log(self.pd.status)
-            if self.pd.status == "printing":
-                self.Goto_PrintProcess()
-            elif self.pd.status in ["operational", "complete", "standby", "cancelled"]:
-                self.Goto_MainMenu()
-
-        if self.checkkey == self.PrintProcess:
-            if self.pd.HMI_flag.print_finish and not self.pd.HMI_flag.done_confirm_flag:
-                self.pd.HMI_flag.print_finish = False
-                self.pd.HMI_flag.done_confirm_flag = True
-                # show percent bar and value
-                self.Draw_Print_ProgressBar(0)
-                # show print done confirm
-                self.lcd.draw_rectangle(
-                    1,
-                    self.color_background_black,
-                    0,
-                    250,
-                    self.lcd.screen_width - 1,
-                    self.STATUS_Y,
-                )
-                self.lcd.draw_icon(
-                    True,
-                    self.selected_language,
-                    self.icon_confirm_button,
-                    86,
-                    283,
-                )
-            elif self.pd.HMI_flag.pause_flag != self.pd.printingIsPaused():
-                # print status update
-                self.pd.HMI_flag.pause_flag = self.pd.printingIsPaused()
-                if self.pd.HMI_flag.pause_flag:
-                    self.show_continue()
-                else:
-                    self.show_pause()
-            self.Draw_Print_ProgressBar()
-            self.Draw_Print_ProgressElapsed()
-            self.Draw_Print_ProgressRemain()
-
-        if self.pd.HMI_flag.home_flag:
-            if self.pd.ishomed():
-                self.CompletedHoming()
-
-        if update and self.checkkey != self.MainMenu:
-            self.Draw_Status_Area(update)
+        with self.lcd.batch():
+            # variable update
+            update = self.pd.update_variable()
+            if self.last_status != self.pd.status:
+                self.last_status = self.pd.status
+                self.log(self.pd.status)
+                if self.pd.status == "printing":
+                    self.Goto_PrintProcess()
+                elif self.pd.status in ["operational", "complete", "standby", "cancelled"]:
+                    self.Goto_MainMenu()
 
-        self.time_since_movement += 1
-        if (self.time_since_movement >= self.display_dim_timeout) & (not self.is_dimmed):
-            self.lcd.set_backlight_brightness(5)
-            self.is_dimmed = True
-        elif (self.time_since_movement < self.display_dim_timeout) & (self.is_dimmed):
-            self.lcd.set_backlight_brightness(40)
-            self.is_dimmed = False
+            if self.checkkey == self.PrintProcess:
+                if self.pd.HMI_flag.print_finish and not self.pd.HMI_flag.done_confirm_flag:
+                    self.pd.HMI_flag.print_finish = False
+                    self.pd.HMI_flag.done_confirm_flag = True
+                    # show percent bar and value
+                    self.Draw_Print_ProgressBar(0)
+                    # show print done confirm
+                    self.lcd.draw_rectangle(
+                        1,
+                        self.color_background_black,
+                        0,
+                        250,
+                        self.lcd.screen_width - 1,
+                        self.STATUS_Y,
+                    )
+                    self.lcd.draw_icon(
+                        True,
+                        self.selected_language,
+                        self.icon_confirm_button,
+                        86,
+                        283,
+                    )
+                elif self.pd.HMI_flag.pause_flag != self.pd.printingIsPaused():
+                    # print status update
+                    self.pd.HMI_flag.pause_flag = self.pd.printingIsPaused()
+                    if self.pd.HMI_flag.pause_flag:
+                        self.show_continue()
+                    else:
+                        self.show_pause()
+                self.Draw_Print_ProgressBar()
+                self.Draw_Print_ProgressElapsed()
+                self.Draw_Print_ProgressRemain()
+
+            if self.pd.HMI_flag.home_flag:
+                if self.pd.ishomed():
+                    self.CompletedHoming()
+
+            if update and self.checkkey != self.MainMenu:
+                self.Draw_Status_Area(update)
+
+            self.time_since_movement += 1
+            if (self.time_since_movement >= self.display_dim_timeout) & (not self.is_dimmed):
+                self.lcd.set_backlight_brightness(5)
+                self.is_dimmed = True
+            elif (self.time_since_movement < self.display_dim_timeout) & (self.is_dimmed):
+                self.lcd.set_backlight_brightness(40)
+                self.is_dimmed = False
 
         return eventtime + self._update_interval
 